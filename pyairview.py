@@ -62,6 +62,7 @@ import logging
 import threading
 import sys
 import re
+import numbers
 try:
     import serial
 except ImportError:
@@ -111,6 +112,8 @@ AIRVIEW_COMMAND_END_SCAN        = b'es'
 
 AIRVIEW_PROTOCOL_DELIMITER = b'\n'
 
+AIRVIEW_SCAN_SAMPLE_COUNT = 173
+
 
 AIRVIEW_DEVICE_USB_ID             = 'AIRVIEW_DEVICE_USB_ID'
 AIRVIEW_DEVICE_FIRMWARE_VERSION   = 'AIRVIEW_DEVICE_FIRMWARE_VERSION'
@@ -139,6 +142,9 @@ _rx_thread = None
 # scan thread exit event
 _rx_thread_stop = threading.Event()
 
+# frames suppressed since the last callback when change suppression is enabled
+_suppressed_count = 0
+
 _log = logging.getLogger(__name__)
 
 
@@ -205,7 +211,52 @@ def _parse_command_response(buffer):
     return None, None, None
 
 
-def _begin_scan_loop(callback, thread_stop):
+def _expand_threshold(threshold):
+    """
+        Validate a change suppression threshold passed to start_scan().
+
+        threshold is either a single number applied to every bin, or a list
+        with one number per bin.
+
+        Returns a list with one threshold per bin, raises TypeError or
+        ValueError if the threshold can't be used
+
+    """
+    if isinstance(threshold, numbers.Real) and not isinstance(threshold, bool):
+        return [threshold] * AIRVIEW_SCAN_SAMPLE_COUNT
+    try:
+        thresholds = list(threshold)
+    except TypeError:
+        raise TypeError('suppress_threshold must be a number or a list of numbers')
+    for bin_threshold in thresholds:
+        if not isinstance(bin_threshold, numbers.Real) or isinstance(bin_threshold, bool):
+            raise TypeError('suppress_threshold list must only contain numbers')
+    if len(thresholds) != AIRVIEW_SCAN_SAMPLE_COUNT:
+        raise ValueError('suppress_threshold list must have %d values, got %d' %
+                         (AIRVIEW_SCAN_SAMPLE_COUNT, len(thresholds)))
+    return thresholds
+
+
+def _frame_changed(last_rssi_list, rssi_list, thresholds):
+    """
+        Compare a scan frame to the last frame emitted to the callback.
+
+        thresholds is a list with one threshold per bin, as returned by
+        _expand_threshold(). A frame has changed if any bin differs from the
+        same bin in the last emitted frame by at least its threshold.
+
+        Returns True if the frame has changed
+
+    """
+    if last_rssi_list is None:
+        return True
+    for last_rssi, rssi, bin_threshold in zip(last_rssi_list, rssi_list, thresholds):
+        if abs(rssi - last_rssi) >= bin_threshold:
+            return True
+    return False
+
+
+def _begin_scan_loop(callback, thread_stop, suppress_threshold=None, keyframe_interval=None):
     """
         Initiate the primary feature of the device: continuous RF power level 
         scanning across the covered RF range. 
@@ -216,9 +267,16 @@ def _begin_scan_loop(callback, thread_stop):
         it may be better to yield instead and possibly find a solutiont that 
         avoids the need for threading altogether.
 
+        If suppress_threshold is set, frames that have not changed since the
+        last emitted frame are dropped instead of being returned, see
+        start_scan() for details.
+
     """
+    global _suppressed_count
     _log.debug('Scan thread loop running')
 
+    last_rssi_list = None
+    _suppressed_count = 0
 
     _send_command(AIRVIEW_COMMAND_BEGIN_SCAN)
     _log.debug('Begin scan command sent to device')
@@ -249,8 +307,19 @@ def _begin_scan_loop(callback, thread_stop):
                     5GHz devices.
                 
                 """
-                if len(rssi_list) == 173:
-                    callback(rssi_list=rssi_list)
+                if len(rssi_list) == AIRVIEW_SCAN_SAMPLE_COUNT:
+                    if suppress_threshold is None:
+                        callback(rssi_list=rssi_list)
+                        continue
+                    keyframe = keyframe_interval is not None and _suppressed_count >= keyframe_interval - 1
+                    if keyframe or _frame_changed(last_rssi_list, rssi_list, suppress_threshold):
+                        suppressed = _suppressed_count
+                        _suppressed_count = 0
+                        callback(rssi_list=rssi_list, suppressed=suppressed)
+                        last_rssi_list = rssi_list
+                    else:
+                        _log.debug('Suppressed unchanged scan frame')
+                        _suppressed_count = _suppressed_count + 1
             else:
                 _log.debug('Got unknown response during scan: %s', buffer)
                 continue
@@ -412,15 +481,41 @@ def get_device_info():
 
 
 
-def start_scan(callback):
+def start_scan(callback, suppress_threshold=None, keyframe_interval=None):
     """
         Start the scan thread and block the caller until the thread
         gracefully exits. Call stop_scan() to do that.
 
+        By default every scan frame is returned in the callback. Setting
+        suppress_threshold enables change suppression: a frame is only
+        returned if at least one RSSI value differs from the last returned
+        frame by suppress_threshold or more. It may be a single number, or a
+        list with one threshold per RSSI value. The callback must then also
+        accept a parameter named 'suppressed', the number of frames dropped
+        since the previous callback. Frames dropped after the last callback
+        are not reported there, use get_suppressed_count() to read them once
+        the scan has stopped.
+
+        keyframe_interval forces a frame to be returned at least once every
+        keyframe_interval frames while suppression is enabled, even if
+        nothing has changed.
+
+        Raises TypeError or ValueError if either option is invalid
+
     """
     global _rx_thread
+    if suppress_threshold is not None:
+        suppress_threshold = _expand_threshold(suppress_threshold)
+    if keyframe_interval is not None:
+        if suppress_threshold is None:
+            raise ValueError('keyframe_interval requires suppress_threshold')
+        if not isinstance(keyframe_interval, numbers.Integral) or isinstance(keyframe_interval, bool):
+            raise TypeError('keyframe_interval must be an integer')
+        if keyframe_interval < 1:
+            raise ValueError('keyframe_interval must be at least 1')
     _log.debug('Starting scan in background thread')
-    _rx_thread = threading.Thread(target=_begin_scan_loop, args=(callback, _rx_thread_stop))
+    _rx_thread = threading.Thread(target=_begin_scan_loop,
+                                  args=(callback, _rx_thread_stop, suppress_threshold, keyframe_interval))
     _rx_thread.start()
 
 
@@ -428,6 +523,17 @@ def is_scanning():
     return _rx_thread.is_alive()
 
 
+def get_suppressed_count():
+    """
+        Returns the number of frames suppressed since the last callback when
+        change suppression is enabled. After stop_scan() this is the count
+        for the quiet period at the end of the scan, which no callback
+        reported.
+
+    """
+    return _suppressed_count
+
+
 def stop_scan():
     """
         Use a thread event to cause the scan loop to gracefully exit.
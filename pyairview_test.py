@@ -36,6 +36,9 @@ from __future__ import print_function, division
     Command: scan
     
             Demonstrates the RSSI scan stream function, no arguments are needed.
+            
+            Change suppression can be enabled with a threshold (-t 3), and a
+            keyframe interval (-k 50) can be added to it.
 
 """
 
@@ -64,14 +67,18 @@ mainHandler.setFormatter(logging.Formatter('%(message)s'))
 log.addHandler(mainHandler)
 
 
-def scan_callback(rssi_list):
+def scan_callback(rssi_list, suppressed=0):
+    if suppressed:
+        log.info('Suppressed %d unchanged scans', suppressed)
     log.info('Received %d RSSI level readings: %s', len(rssi_list), rssi_list)
 
 
 def scan(args):
     log.info('Starting Airview RSSI scan')
     try:
-        pyairview.start_scan(callback=scan_callback)
+        pyairview.start_scan(callback=scan_callback,
+                             suppress_threshold=args.threshold,
+                             keyframe_interval=args.keyframe)
         while pyairview.is_scanning():
             sleep(0.1)
     except KeyboardInterrupt as e:
@@ -80,6 +87,8 @@ def scan(args):
     except Exception as e:
         log.exception('Unknown error occurred')
     finally:
+        if args.threshold is not None:
+            log.info('Suppressed %d unchanged scans at the end', pyairview.get_suppressed_count())
         log.info('Scan ended')
         pyairview.disconnect()
 
@@ -147,6 +156,8 @@ if __name__ == '__main__':
     parser_fuzzer.set_defaults(func=fuzzer)
 
     parser_scan = subparsers.add_parser('scan')
+    parser_scan.add_argument('-t', '--threshold', type=int, help='Only show scans where an RSSI level changed by at least this much')
+    parser_scan.add_argument('-k', '--keyframe', type=int, help='Show at least one scan in this many, requires -t')
     parser_scan.set_defaults(func=scan)
 
     device_info_scan = subparsers.add_parser('deviceinfo')
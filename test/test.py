@@ -3,9 +3,106 @@
 from __future__ import absolute_import
 
 import sys
+import threading
+import unittest
 
 import pyairview
 
+
+FRAME_SIZE = pyairview.AIRVIEW_SCAN_SAMPLE_COUNT
+
+
+def frame(level):
+    return [level] * FRAME_SIZE
+
+
+class FrameChangedTest(unittest.TestCase):
+
+    def test_first_frame(self):
+        thresholds = pyairview._expand_threshold(5)
+        self.assertTrue(pyairview._frame_changed(None, frame(-90), thresholds))
+
+    def test_scalar_threshold(self):
+        thresholds = pyairview._expand_threshold(5)
+        self.assertFalse(pyairview._frame_changed(frame(-90), frame(-86), thresholds))
+        self.assertTrue(pyairview._frame_changed(frame(-90), frame(-85), thresholds))
+        self.assertTrue(pyairview._frame_changed(frame(-90), frame(-95), thresholds))
+
+    def test_float_threshold(self):
+        thresholds = pyairview._expand_threshold(2.5)
+        self.assertFalse(pyairview._frame_changed(frame(-90), frame(-88), thresholds))
+        self.assertTrue(pyairview._frame_changed(frame(-90), frame(-87), thresholds))
+
+    def test_per_bin_threshold(self):
+        thresholds = pyairview._expand_threshold([100] * (FRAME_SIZE - 1) + [1])
+        current = frame(-90)
+        current[0] = -50
+        self.assertFalse(pyairview._frame_changed(frame(-90), current, thresholds))
+        current[-1] = -89
+        self.assertTrue(pyairview._frame_changed(frame(-90), current, thresholds))
+
+    def test_invalid_threshold(self):
+        self.assertRaises(ValueError, pyairview._expand_threshold, [5])
+        self.assertRaises(TypeError, pyairview._expand_threshold, 'a')
+        self.assertRaises(TypeError, pyairview._expand_threshold, None)
+        self.assertRaises(TypeError, pyairview._expand_threshold, True)
+        self.assertRaises(TypeError, pyairview._expand_threshold, ['a'] * FRAME_SIZE)
+
+
+class StartScanTest(unittest.TestCase):
+
+    def test_invalid_keyframe_interval(self):
+        self.assertRaises(ValueError, pyairview.start_scan, None, keyframe_interval=10)
+        self.assertRaises(ValueError, pyairview.start_scan, None, suppress_threshold=5, keyframe_interval=0)
+        self.assertRaises(TypeError, pyairview.start_scan, None, suppress_threshold=5, keyframe_interval=1.5)
+
+    def test_invalid_threshold(self):
+        self.assertRaises(ValueError, pyairview.start_scan, None, suppress_threshold=[5])
+
+
+class ScanLoopTest(unittest.TestCase):
+
+    def setUp(self):
+        self._send_command = pyairview._send_command
+        self._read_response = pyairview._read_response
+        pyairview._send_command = lambda command_string: None
+
+    def tearDown(self):
+        pyairview._send_command = self._send_command
+        pyairview._read_response = self._read_response
+
+    def scan(self, levels, suppress_threshold=None, keyframe_interval=None):
+        responses = [('scan|0,' + ' '.join(str(level) for level in frame(level)) + '\n').encode('ascii')
+                     for level in levels]
+        responses.reverse()
+        pyairview._read_response = lambda: bytearray(responses.pop()) if responses else None
+        results = []
+
+        def callback(rssi_list, suppressed=None):
+            results.append((rssi_list[0], suppressed))
+
+        if suppress_threshold is not None:
+            suppress_threshold = pyairview._expand_threshold(suppress_threshold)
+        pyairview._begin_scan_loop(callback, threading.Event(), suppress_threshold, keyframe_interval)
+        return results
+
+    def test_no_suppression(self):
+        self.assertEqual(self.scan([-90, -90]), [(-90, None), (-90, None)])
+
+    def test_suppression(self):
+        results = self.scan([-90, -90, -89, -80, -80, -80], suppress_threshold=5)
+        self.assertEqual(results, [(-90, 0), (-80, 2)])
+        self.assertEqual(pyairview.get_suppressed_count(), 2)
+
+    def test_keyframe(self):
+        results = self.scan([-90] * 9, suppress_threshold=5, keyframe_interval=4)
+        self.assertEqual(results, [(-90, 0), (-90, 3), (-90, 3)])
+        self.assertEqual(pyairview.get_suppressed_count(), 0)
+
+    def test_keyframe_every_frame(self):
+        results = self.scan([-90] * 3, suppress_threshold=5, keyframe_interval=1)
+        self.assertEqual(results, [(-90, 0), (-90, 0), (-90, 0)])
+
+
 if __name__ == '__main__':
-    sys.exit(0)
-    
\ No newline at end of file
+    unittest.main()